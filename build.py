@@ -1,17 +1,114 @@
 #!/usr/bin/env python3
 import os
+import argparse
+import io
+import sys
+import time
 import json
+import logging
 import re
 import urllib.request
 import urllib.error
-import shutil
+import zlib
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Any
-from PIL import Image
+from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple, Set, FrozenSet, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.exceptions import HTTPError as Urllib3Error
+    from urllib3.util.retry import Retry
+except ImportError:  # Fall back to urllib, one connection per request
+    requests = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+log = logging.getLogger('loudounvelo')
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    value = os.environ.get(name) or str(default)
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = minimum - 1
+    if parsed < minimum:
+        log.warning(f"⚠️ Invalid {name} '{value}', using {default}.")
+        return default
+    return parsed
+
+USER_AGENT = 'LoudounVelo-SiteBuilder/1.0'
+
+# Transient failures are retried with exponential backoff
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Upper bound on a single response body, after decompression
+MAX_RESPONSE_BYTES = 32 * 1024 * 1024
+
+# Errors raised by _http_get when no response was received
+NETWORK_ERRORS = (urllib.error.URLError, TimeoutError) + ((requests.RequestException, Urllib3Error) if requests else ())
+
+# Concurrent route fetches; every request goes to ridewithgps.com
+MAX_FETCH_WORKERS = _env_int('FETCH_WORKERS', 8, minimum=1)
+
+# Cached routes younger than this many seconds are used without revalidating
+ROUTE_CACHE_TTL = _env_int('ROUTE_CACHE_TTL', 24 * 60 * 60, minimum=0)
+
+# Map previews are simple line art, so a lossy, slow-but-small encode is fine
+WEBP_SAVE_OPTIONS = {'quality': 80, 'method': 6, 'lossless': False}
+
+# Route cards show maps at about 400x300, so this covers 3x displays
+MAP_IMAGE_MAX_SIZE = (1200, 900)
+
+# Route types the index page knows how to filter and badge
+VALID_ROUTE_TYPES: FrozenSet[str] = frozenset({'road', 'gravel'})
+
+_ROUTE_ID_RE = re.compile(r'/routes/(\d+)')
+_PLACEHOLDER_RE = re.compile(rb'\{\{(\w+)\}\}')
+
+@dataclass(frozen=True)
+class RideEntry:
+    """A validated line from rides.txt."""
+    route_id: str
+    url: str
+    route_type: str
+
+def _check_response_size(url: str, body: bytes) -> bytes:
+    if len(body) > MAX_RESPONSE_BYTES:
+        raise ValueError(f"Response from {url} is larger than {MAX_RESPONSE_BYTES // (1024 * 1024)} MiB")
+    return body
+
+def _read_body(url: str, response: Any) -> bytes:
+    """Read a size-capped urllib response body, inflating gzip if needed."""
+    body = _check_response_size(url, response.read(MAX_RESPONSE_BYTES + 1))
+    if response.headers.get('Content-Encoding', '').lower() == 'gzip':
+        body = zlib.decompressobj(wbits=31).decompress(body, MAX_RESPONSE_BYTES + 1)
+    return _check_response_size(url, body)
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
 
 class BikeRoutesBuilder:
-    def __init__(self):
+    # Fields the page template expects on every route
+    ROUTE_DEFAULTS = {'distance': 0, 'elevation': 0, 'image': '', 'profile': (), 'type': 'road'}
+
+    def __init__(self, force_refresh: bool = False):
+        self.force_refresh = force_refresh
         self.rides_file = Path('./rides.txt')
         self.routes_dir = Path('./routes')
         self.dist_dir = Path('./dist')
@@ -24,174 +121,336 @@ class BikeRoutesBuilder:
         self.planner_dist_dir = self.dist_dir / 'planner'
         self.ingredients_file = Path('./ingredients.txt')
         self.routes: List[Dict[str, Any]] = []
+        self._existing_images: Set[str] = set()
+        self._session = self._create_session()
 
     def build(self):
-        print("🚴 Building Loudoun Velo Routes Site...\n")
+        log.info("🚴 Building Loudoun Velo Routes Site...\n")
         try:
             self._ensure_directory_exists(self.dist_dir)
             self._ensure_directory_exists(self.images_dir)
+            self._ensure_directory_exists(self.routes_dir)
             self._load_routes()
             self._process_routes()
             self._generate_html()
             self._build_mix_page()
             self._build_planner_page()
             self._copy_assets()
-            print("\n✅ Build completed successfully!")
-            print(f"📁 Output is in the 'dist' directory.")
-            print(f"🌐 Processed {len(self.routes)} routes.")
+            log.info("\n✅ Build completed successfully!")
+            log.info("📁 Output is in the 'dist' directory.")
+            log.info(f"🌐 Processed {len(self.routes)} routes.")
         except Exception as error:
-            print(f"❌ Build failed: {error}")
+            log.error(f"❌ Build failed: {error}")
             exit(1)
 
     def _ensure_directory_exists(self, directory: Path):
         if not directory.exists():
             directory.mkdir(parents=True, exist_ok=True)
-            print(f"📁 Created directory: {directory}")
+            log.info(f"📁 Created directory: {directory}")
+
+    def _atomic_write(self, path: Path, data: bytes):
+        """Write data via a sibling temp file so path is never left half-written."""
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _write_if_changed(self, path: Path, content: Union[bytes, str]) -> bool:
+        """Write content (text as UTF-8) unless path already holds it; True if written."""
+        encoded = content.encode('utf-8') if isinstance(content, str) else content
+        if path.exists() and path.stat().st_size == len(encoded) and path.read_bytes() == encoded:
+            return False
+        self._atomic_write(path, encoded)
+        return True
+
+    def _read_rides_file(self) -> List[RideEntry]:
+        """Parse rides.txt, skipping comments and blank lines and dropping bad or duplicate entries."""
+        entries: List[RideEntry] = []
+        processed_route_ids = set()
+
+        with open(self.rides_file, 'r', encoding='utf-8') as file:
+            for raw_line in file:
+                line = raw_line.strip()
+                if not line or line.startswith('#'):
+                    continue
+
+                parts = [part.strip() for part in line.split(',')]
+                url = parts[0]
+                specified_type = parts[1].lower() if len(parts) > 1 else 'road'
+
+                route_match = _ROUTE_ID_RE.search(url)
+                if not route_match:
+                    log.warning(f"  ⚠️ Invalid URL format, skipping: {url}")
+                    continue
+
+                route_id = route_match.group(1)
+
+                if route_id in processed_route_ids:
+                    log.warning(f"  ⚠️ Duplicate route ID {route_id} found, skipping.")
+                    continue
+
+                if specified_type not in VALID_ROUTE_TYPES:
+                    log.warning(f"  ⚠️ Unknown route type '{specified_type}' for route {route_id}, using 'road'.")
+                    specified_type = 'road'
+
+                processed_route_ids.add(route_id)
+                entries.append(RideEntry(route_id, url, specified_type))
+
+        return entries
+
+    def _list_files(self, directory: Path) -> Set[str]:
+        """Return the names of regular files in directory (empty if it is missing)."""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return set()
 
     def _load_routes(self):
-        print("📖 Loading route definitions...")
+        log.info("📖 Loading route definitions...")
         if not self.rides_file.exists():
-            print("  ⚠️ rides.txt not found. Please create it with RideWithGPS URLs.")
+            log.warning("  ⚠️ rides.txt not found. Please create it with RideWithGPS URLs.")
             return
 
-        with open(self.rides_file, 'r', encoding='utf-8') as file:
-            lines = [line.strip() for line in file if line.strip() and not line.strip().startswith('#')]
-        
-        print(f"  Found {len(lines)} RideWithGPS URLs to process.")
-        processed_route_ids = set()
+        entries = self._read_rides_file()
+        log.info(f"  Found {len(entries)} RideWithGPS routes to process.")
+
+        # One directory listing instead of an exists() check per route
+        self._existing_images = self._list_files(self.images_dir)
 
-        for i, line in enumerate(lines):
-            parts = [part.strip() for part in line.split(',')]
-            url = parts[0]
-            specified_type = parts[1].lower() if len(parts) > 1 else 'road'
-            
-            print(f"\n  ({i+1}/{len(lines)}) Processing: {url}")
-            
-            route_match = re.search(r'/routes/(\d+)', url)
-            if not route_match:
-                print("    - ⚠️ Invalid URL format, skipping.")
-                continue
-                
-            route_id = route_match.group(1)
-            
-            if route_id in processed_route_ids:
-                print(f"    - ⚠️ Duplicate route ID {route_id} found, skipping.")
-                continue
-            
-            processed_route_ids.add(route_id)
-            
-            route_data = self._fetch_from_rwgps_json(route_id)
+        # executor.map keeps results in rides.txt order
+        log.info(f"  Fetching {len(entries)} routes with up to {MAX_FETCH_WORKERS} workers...")
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            results = list(executor.map(self._fetch_from_rwgps_json, [entry.route_id for entry in entries]))
+
+        for entry, route_data in zip(entries, results):
             if route_data:
-                route_data['type'] = specified_type
-                route_data['rwgpsUrl'] = url
+                route_data['type'] = entry.route_type
+                route_data['rwgpsUrl'] = entry.url
                 self.routes.append(route_data)
-                print(f"    ✓ Added: {route_data['title']}")
+                log.debug(f"    ✓ Added: {route_data['title']}")
             else:
-                print(f"    - ❌ Failed to fetch or parse data for route {route_id}")
-
+                log.error(f"    - ❌ Failed to fetch or parse data for route {entry.route_id}")
 
     def _process_routes(self):
-        print("\n🔄 Processing routes for data consistency...")
-        # This can be expanded later if needed
+        log.info("\n🔄 Processing routes for data consistency...")
         for route in self.routes:
-            if 'distance' not in route:
-                route['distance'] = 0
-            if 'elevation' not in route:
-                route['elevation'] = 0
-            if 'profile' not in route:
-                route['profile'] = []
-
-    def _fetch_from_rwgps_json(self, route_id: str) -> Dict[str, Any] | None:
+            for key, default in self.ROUTE_DEFAULTS.items():
+                route.setdefault(key, default)
+
+    def _create_session(self):
+        if requests is None:
+            return None
+        session = requests.Session()
+        session.headers.update({'User-Agent': USER_AGENT})
+        retries = Retry(total=HTTP_RETRIES, backoff_factor=HTTP_RETRY_BACKOFF,
+                        status_forcelist=sorted(HTTP_RETRY_STATUSES), allowed_methods={'GET'},
+                        raise_on_status=False)
+        # One host, so a single pool with a connection per fetch worker
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_FETCH_WORKERS, max_retries=retries)
+        session.mount('https://', adapter)
+        return session
+
+    def _http_get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10) -> Tuple[int, Any, bytes]:
+        """GET url and return (status, headers, body); HTTP error statuses are not raised."""
+        headers = {'User-Agent': USER_AGENT, **(headers or {})}
+        if self._session is not None:
+            with self._session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+                body = response.raw.read(MAX_RESPONSE_BYTES + 1, decode_content=True)
+                return response.status_code, response.headers, _check_response_size(url, body)
+
+        req = urllib.request.Request(url, headers={'Accept-Encoding': 'gzip', **headers})
+        for attempt in range(HTTP_RETRIES + 1):
+            if attempt:
+                time.sleep(HTTP_RETRY_BACKOFF * 2 ** (attempt - 1))
+            try:
+                with urllib.request.urlopen(req, timeout=timeout) as response:
+                    return response.status, response.headers, _read_body(url, response)
+            except urllib.error.HTTPError as e:
+                if e.code not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRIES:
+                    return e.code, e.headers, _read_body(url, e)
+            except NETWORK_ERRORS:
+                if attempt == HTTP_RETRIES:
+                    raise
+
+    def _route_cache_path(self, route_id: str) -> Path:
+        return self.routes_dir / f'route-{route_id}.json'
+
+    def _read_route_cache(self, route_id: str) -> Optional[Dict[str, Any]]:
+        cache_file = self._route_cache_path(route_id)
+        try:
+            entry = _json_loads(cache_file.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.warning(f"    - ⚠️ Route {route_id}: ignoring unreadable cache file: {e}")
+            return None
+        return entry if isinstance(entry, dict) and 'route' in entry else None
+
+    def _write_route_cache(self, route_id: str, summary: Dict[str, Any], response_headers: Any):
+        entry = {
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+            'route': summary
+        }
+        self._atomic_write(self._route_cache_path(route_id), _json_dumps(entry))
+
+    def _summarize_route(self, route_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        route_info = data.get('route', data)
+
+        if not route_info or 'name' not in route_info:
+            log.warning(f"    - ⚠️ Route {route_id}: could not find route name in JSON response.")
+            return None
+
+        distance_m = route_info.get('distance', 0)
+        elevation_m = route_info.get('elevation_gain', 0)
+
+        # Decimate before converting, keeping about 250 points
+        track_points = route_info.get('track_points') or []
+        step = max(1, len(track_points) // 250)
+        profile = [[pt.get('d', 0) / 1000, pt.get('e', 0)] for pt in track_points[::step]]
+
+        return {
+            'title': route_info.get('name', f'Route {route_id}'),
+            'distance': round(distance_m / 1000, 1) if distance_m else 0,
+            'elevation': round(elevation_m) if elevation_m else 0,
+            'profile': profile
+        }
+
+    def _fetch_route_summary(self, route_id: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Return (summary, changed), where changed means the summary differs from the cache."""
+        cache_file = self._route_cache_path(route_id)
+        cached = self._read_route_cache(route_id)
+        headers = {'Accept': 'application/json'}
+
+        if cached and not self.force_refresh:
+            if time.time() - cache_file.stat().st_mtime < ROUTE_CACHE_TTL:
+                return cached['route'], False
+            # Revalidate; an unchanged route comes back as a 304
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
         api_url = f"https://ridewithgps.com/routes/{route_id}.json"
-        headers = {'User-Agent': 'LoudounVelo-SiteBuilder/1.0', 'Accept': 'application/json'}
-        
         try:
-            req = urllib.request.Request(api_url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status != 200:
-                    print(f"    - ⚠️ HTTP Error {response.status}")
-                    return None
-                
-                data = json.loads(response.read().decode('utf-8'))
-                
-                route_info = data.get('route', data)
-
-                if not route_info or 'name' not in route_info:
-                    print("    - ⚠️ Could not find route name in JSON response.")
-                    return None
-
-                distance_m = route_info.get('distance', 0)
-                elevation_m = route_info.get('elevation_gain', 0)
-
-                profile = []
-                if 'track_points' in route_info:
-                    profile = [[pt.get('d', 0) / 1000, pt.get('e', 0)] for pt in route_info['track_points']]
-                
-                if len(profile) > 250:
-                    step = len(profile) // 250
-                    profile = profile[::step]
-                
-                image_url = f'https://ridewithgps.com/routes/{route_id}/full.png'
-                webp_path = self.images_dir / f'{route_id}.webp'
-                
-                if not webp_path.exists():
-                    try:
-                        with urllib.request.urlopen(image_url) as img_response:
-                            img = Image.open(img_response)
-                            img.save(webp_path, 'webp', quality=95)
-                            print(f"    - ✓ Converted image to WebP: {webp_path.name}")
-                    except Exception as img_error:
-                        print(f"    - ⚠️ Could not process image: {img_error}")
-                        webp_path = None
-
-                return {
-                    'id': f'route-{route_id}',
-                    'title': route_info.get('name', f'Route {route_id}'),
-                    'distance': round(distance_m / 1000, 1) if distance_m else 0,
-                    'elevation': round(elevation_m) if elevation_m else 0,
-                    'image': f'images/{webp_path.name}' if webp_path else '',
-                    'profile': profile
-                }
-
-        except urllib.error.URLError as e:
-            print(f"    - ❌ Network error fetching route: {e}")
+            status, response_headers, body = self._http_get(api_url, headers=headers)
+        except NETWORK_ERRORS as e:
+            if not cached:
+                raise
+            log.warning(f"    - ⚠️ Route {route_id}: network error ({e}), using cached copy.")
+            return cached['route'], False
+        if status == 304 and cached:
+            os.utime(cache_file)  # Confirmed current; restart the TTL
+            return cached['route'], False
+        if cached and status in HTTP_RETRY_STATUSES:
+            log.warning(f"    - ⚠️ Route {route_id}: HTTP Error {status}, using cached copy.")
+            return cached['route'], False
+        if status != 200:
+            log.warning(f"    - ⚠️ Route {route_id}: HTTP Error {status}")
+            return None, False
+
+        summary = self._summarize_route(route_id, _json_loads(body))
+        if summary is not None:
+            self._write_route_cache(route_id, summary, response_headers)
+        return summary, cached is None or summary != cached['route']
+
+    def _fetch_route_image(self, route_id: str, webp_path: Path) -> bool:
+        """Download a route's full.png map and save it as WebP; False on failure."""
+        image_url = f'https://ridewithgps.com/routes/{route_id}/full.png'
+        # Lazy import, outside the try so a missing Pillow fails the build
+        from PIL import Image
+
+        try:
+            status, _, img_bytes = self._http_get(image_url, timeout=30)
+            if status != 200:
+                raise ValueError(f"HTTP Error {status}")
+            img = Image.open(io.BytesIO(img_bytes))
+            # thumbnail() falls back to NEAREST for palette and 1-bit images
+            if img.mode in ('P', '1'):
+                img = img.convert('RGBA')
+            img.thumbnail(MAP_IMAGE_MAX_SIZE, Image.Resampling.LANCZOS)
+            # Drop an alpha channel that is opaque everywhere
+            if img.mode == 'RGBA' and img.getchannel('A').getextrema() == (255, 255):
+                img = img.convert('RGB')
+            webp_data = io.BytesIO()
+            img.save(webp_data, 'webp', **WEBP_SAVE_OPTIONS)
+            self._atomic_write(webp_path, webp_data.getvalue())
+            log.debug(f"    - ✓ Route {route_id}: converted image to WebP: {webp_path.name}")
+            return True
+        except Exception as img_error:
+            log.warning(f"    - ⚠️ Route {route_id}: could not process image: {img_error}")
+            return False
+
+    def _fetch_from_rwgps_json(self, route_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            summary, changed = self._fetch_route_summary(route_id)
+            if summary is None:
+                return None
+
+            webp_path = self.images_dir / f'{route_id}.webp'
+            has_image = webp_path.name in self._existing_images
+
+            # Maps only change with the route; keep the old image if a refresh fails
+            if changed or not has_image:
+                has_image = self._fetch_route_image(route_id, webp_path) or has_image
+
+            return {
+                'id': f'route-{route_id}',
+                'title': summary['title'],
+                'distance': summary['distance'],
+                'elevation': summary['elevation'],
+                'image': f'images/{webp_path.name}' if has_image else '',
+                'profile': summary['profile']
+            }
+
+        except ImportError:
+            raise
+        except NETWORK_ERRORS as e:
+            log.error(f"    - ❌ Route {route_id}: network error fetching route: {e}")
             return None
         except json.JSONDecodeError:
-            print("    - ❌ Error decoding JSON from API.")
+            log.error(f"    - ❌ Route {route_id}: error decoding JSON from API.")
             return None
         except Exception as e:
-            print(f"    - ❌ An unexpected error occurred: {e}")
+            log.error(f"    - ❌ Route {route_id}: an unexpected error occurred: {e}")
             return None
 
     def _generate_html(self):
-        print("\n🎨 Generating HTML file...")
+        log.info("\n🎨 Generating HTML file...")
         if not self.template_path.exists():
-            print(f"  ⚠️ Template not found at {self.template_path}. Aborting.")
+            log.error(f"  ⚠️ Template not found at {self.template_path}. Aborting.")
             exit(1)
 
-        with open(self.template_path, 'r', encoding='utf-8') as f:
-            template = f.read()
+        # Work on bytes to skip a decode/encode round trip
+        template = self.template_path.read_bytes()
 
-        if '{{ROUTES_DATA}}' not in template:
-            print("  ⚠️ '{{ROUTES_DATA}}' placeholder not found in the template. Aborting.")
+        if b'{{ROUTES_DATA}}' not in template:
+            log.error("  ⚠️ '{{ROUTES_DATA}}' placeholder not found in the template. Aborting.")
             exit(1)
 
-        self.routes.sort(key=lambda x: x.get('distance', 0) or 0)
+        # _process_routes guarantees every route has a distance
+        self.routes.sort(key=itemgetter('distance'))
 
-        # Generate compact JSON to reduce file size
-        routes_json = json.dumps(self.routes, separators=(',', ':'))
-        html = template.replace('{{ROUTES_DATA}}', routes_json)
-        html = html.replace('{{SITE_TITLE}}', 'Loudoun Velo Routes')
+        substitutions = {
+            b'ROUTES_DATA': _json_dumps(self.routes),
+            b'SITE_TITLE': 'Loudoun Velo Routes'.encode('utf-8'),
+        }
+        # Unknown placeholders are left as-is
+        html = _PLACEHOLDER_RE.sub(lambda m: substitutions.get(m.group(1), m.group(0)), template)
 
-        with open(self.dist_dir / 'index.html', 'w', encoding='utf-8') as f:
-            f.write(html)
-        
-        print("  ✓ Generated index.html")
+        if self._write_if_changed(self.dist_dir / 'index.html', html):
+            log.info("  ✓ Generated index.html")
+        else:
+            log.info("  ✓ index.html is up to date")
 
     def _build_mix_page(self):
-        print("\n🍹 Building Mix Calculator page...")
+        log.info("\n🍹 Building Mix Calculator page...")
         if not self.mix_template_path.exists():
-            print(f"  ⚠️ Mix template not found at {self.mix_template_path}. Skipping.")
+            log.warning(f"  ⚠️ Mix template not found at {self.mix_template_path}. Skipping.")
             return
 
         self._ensure_directory_exists(self.mix_dist_dir)
@@ -199,7 +458,7 @@ class BikeRoutesBuilder:
         # Load ingredients
         ingredients_json = '[]'
         if self.ingredients_file.exists():
-            print(f"  📖 Loading ingredients from {self.ingredients_file}")
+            log.info(f"  📖 Loading ingredients from {self.ingredients_file}")
             ingredients = []
             try:
                 with open(self.ingredients_file, 'r', encoding='utf-8') as f:
@@ -222,45 +481,54 @@ class BikeRoutesBuilder:
                                 'active': False,
                                 'amount': 0
                             })
-                ingredients_json = json.dumps(ingredients)
-                print(f"    ✓ Loaded {len(ingredients)} ingredients")
+                ingredients_json = _json_dumps(ingredients).decode('utf-8')
+                log.info(f"    ✓ Loaded {len(ingredients)} ingredients")
             except Exception as e:
-                print(f"    ❌ Error loading ingredients: {e}")
+                log.error(f"    ❌ Error loading ingredients: {e}")
 
-        with open(self.mix_template_path, 'r', encoding='utf-8') as f:
-            template = f.read()
+        template = self.mix_template_path.read_text(encoding='utf-8')
 
         # Inject ingredients data
         content = template.replace('"{{INGREDIENTS_DATA}}"', ingredients_json)
 
-        with open(self.mix_dist_dir / 'index.html', 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print("  ✓ Generated mix/index.html")
+        if self._write_if_changed(self.mix_dist_dir / 'index.html', content):
+            log.info("  ✓ Generated mix/index.html")
+        else:
+            log.info("  ✓ mix/index.html is up to date")
 
     def _build_planner_page(self):
-        print("\n🗺️ Building Ride Planner page...")
+        log.info("\n🗺️ Building Ride Planner page...")
         if not self.planner_template_path.exists():
-            print(f"  ⚠️ Planner template not found at {self.planner_template_path}. Skipping.")
+            log.warning(f"  ⚠️ Planner template not found at {self.planner_template_path}. Skipping.")
             return
 
         self._ensure_directory_exists(self.planner_dist_dir)
 
-        with open(self.planner_template_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        with open(self.planner_dist_dir / 'index.html', 'w', encoding='utf-8') as f:
-            f.write(content)
+        content = self.planner_template_path.read_text(encoding='utf-8')
 
-        print("  ✓ Generated planner/index.html")
+        if self._write_if_changed(self.planner_dist_dir / 'index.html', content):
+            log.info("  ✓ Generated planner/index.html")
+        else:
+            log.info("  ✓ planner/index.html is up to date")
 
     def _copy_assets(self):
-        print("\n📋 Copying assets...")
-        with open(self.dist_dir / 'CNAME', 'w') as f:
-            f.write('loudounvelo.com')
-        (self.dist_dir / '.nojekyll').touch()
-        print("  ✓ CNAME and .nojekyll files created.")
+        log.info("\n📋 Copying assets...")
+        self._write_if_changed(self.dist_dir / 'CNAME', 'loudounvelo.com')
+        self._write_if_changed(self.dist_dir / '.nojekyll', '')
+        log.info("  ✓ CNAME and .nojekyll files created.")
 
 if __name__ == '__main__':
-    builder = BikeRoutesBuilder()
+    # LOG_LEVEL=DEBUG shows per-route progress; it only applies to our logger
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    log_level = (os.environ.get('LOG_LEVEL') or 'INFO').upper()
+    if isinstance(logging.getLevelName(log_level), int):
+        log.setLevel(log_level)
+    else:
+        log.warning(f"⚠️ Unknown LOG_LEVEL '{log_level}', using INFO.")
+    parser = argparse.ArgumentParser(description='Build the Loudoun Velo routes site into dist/.')
+    parser.add_argument('--force-refresh', action='store_true',
+                        help='ignore the routes/ cache and download every route again')
+    args = parser.parse_args()
+
+    builder = BikeRoutesBuilder(force_refresh=args.force_refresh)
     builder.build()
\ No newline at end of file